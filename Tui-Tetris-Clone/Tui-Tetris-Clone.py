@@ -13,6 +13,16 @@ ASCII/Unicode Tetris — one-window curses TUI, Aquarium Dark vibe
 import curses
 import time
 import random
+from array import array
+from collections import deque
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the collision kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
 
 # --- Core dims and look ---
 WELL_W, WELL_H = 10, 20
@@ -28,6 +38,9 @@ SOFT_DROP_MULT = 0.05     # soft drop tick
 LOCK_DELAY = 0.5          # lock delay (s)
 NEXT_COUNT = 3
 
+# Seconds per row by level (index = level-1); bottoms out at 0.06 well before the end
+GRAV_TABLE = [max(0.06, TICK_BASE * (0.87 ** (l-1))) for l in range(1, 50)]
+
 # Safe terminal colors (Aquarium Dark-ish vibe)
 PIECE_COLOR = {
     'I': curses.COLOR_CYAN,
@@ -39,45 +52,16 @@ PIECE_COLOR = {
     'L': curses.COLOR_WHITE,
 }
 
-# SRS shapes (grid coordinates relative to a piece's origin)
-SHAPES = {
-    'I': {
-        0: [(0,1),(1,1),(2,1),(3,1)],
-        1: [(2,0),(2,1),(2,2),(2,3)],
-        2: [(0,2),(1,2),(2,2),(3,2)],
-        3: [(1,0),(1,1),(1,2),(1,3)],
-    },
-    'O': {r: [(1,0),(2,0),(1,1),(2,1)] for r in range(4)},
-    'T': {
-        0: [(1,0),(0,1),(1,1),(2,1)],
-        1: [(1,0),(1,1),(2,1),(1,2)],
-        2: [(0,1),(1,1),(2,1),(1,2)],
-        3: [(1,0),(0,1),(1,1),(1,2)],
-    },
-    'S': {
-        0: [(1,0),(2,0),(0,1),(1,1)],
-        1: [(1,0),(1,1),(2,1),(2,2)],
-        2: [(1,1),(2,1),(0,2),(1,2)],
-        3: [(0,0),(0,1),(1,1),(1,2)],
-    },
-    'Z': {
-        0: [(0,0),(1,0),(1,1),(2,1)],
-        1: [(2,0),(1,1),(2,1),(1,2)],
-        2: [(0,1),(1,1),(1,2),(2,2)],
-        3: [(1,0),(0,1),(1,1),(0,2)],
-    },
-    'J': {
-        0: [(0,0),(0,1),(1,1),(2,1)],
-        1: [(1,0),(2,0),(1,1),(1,2)],
-        2: [(0,1),(1,1),(2,1),(2,2)],
-        3: [(1,0),(1,1),(0,2),(1,2)],
-    },
-    'L': {
-        0: [(2,0),(0,1),(1,1),(2,1)],
-        1: [(1,0),(1,1),(1,2),(2,2)],
-        2: [(0,1),(1,1),(2,1),(0,2)],
-        3: [(0,0),(1,0),(1,1),(1,2)],
-    }
+# SRS spawn shapes as 4x4 bitmasks, bit y*4+x = cell (x,y) from the piece's
+# origin. The other rotations are derived below (see orientations()).
+PIECE_MASK = {
+    'I': 0x00F0,
+    'O': 0x0066,
+    'T': 0x0072,
+    'S': 0x0036,
+    'Z': 0x0063,
+    'J': 0x0071,
+    'L': 0x0074,
 }
 
 # SRS kicks
@@ -105,25 +89,142 @@ KICKS_180 = {
     'JLSTZ': [(0,0),(1,0),(-1,0),(0,1),(0,-1),(2,0),(-2,0),(1,1),(-1,1)]
 }
 
+# Integer-keyed kick lookup: group index 0 = I, 1 = JLSTZ (O rotates in place)
+KICK_GROUPS = ('I', 'JLSTZ')
+KICK_TABLE = [[[((0,0),)]*4 for _ in range(4)] for _ in KICK_GROUPS]
+for (group, fr, tr), kicks in SRS_KICKS.items():
+    KICK_TABLE[KICK_GROUPS.index(group)][fr][tr] = tuple(kicks)
+KICK_TABLE_180 = [tuple(KICKS_180[group]) for group in KICK_GROUPS]
+
+# T-Spin corner window: bits 0/2 = top-left/top-right corner of the T's 3x3
+# box, bits 3/5 = bottom-left/bottom-right. The two "front" corners per rotation:
+T_FRONT_MASK = (0b000101, 0b100100, 0b101000, 0b001001)
+
 BAG = ['I','O','T','S','Z','J','L']
+KIND_IDX = {k: i+1 for i,k in enumerate(BAG)}   # 0 = empty cell
+KIND_CHR = '.' + ''.join(BAG)                    # cell value -> kind
+
+# Bitboard playfield: one 32-bit int per row, column x lives at bit x+COL_OFF.
+# The bits either side of the playfield are permanently set (walls), and
+# FLOOR_ROWS solid rows follow the well. Kicks reach at most 4 cells past an
+# edge, so a piece always hits a sentinel instead of needing bounds checks;
+# rows above the top index from the end (rows[-1] ...) and land on the floor.
+COL_OFF = 4
+FLOOR_ROWS = 4
+SOLID_ROW = 0xFFFFFFFF
+FULL_MASK = ((1 << WELL_W) - 1) << COL_OFF
+EMPTY_ROW = SOLID_ROW & ~FULL_MASK
+
+def empty_rows():
+    return array('q', [EMPTY_ROW]*WELL_H + [SOLID_ROW]*FLOOR_ROWS)
+
+# --- Piece rotation on 4x4 bitmasks ---
+def delta_swap(m, mask, shift):
+    # Swap the bits selected by mask with the bits shift places above them
+    t = ((m >> shift) ^ m) & mask
+    return m ^ t ^ (t << shift)
+
+def rotate_cw(m):
+    # Transpose, then mirror each row: (x,y) -> (3-y, x)
+    m = delta_swap(m, 0x0A0A, 3)
+    m = delta_swap(m, 0x00CC, 6)
+    return delta_swap(delta_swap(m, 0x5555, 1), 0x3333, 2)
+
+def orientations(kind):
+    # I turns in its 4x4 box, JLSTZ in the top-left 3x3 (rotating the 4x4 box
+    # leaves column 0 empty, so shift back one column), O doesn't turn
+    m = PIECE_MASK[kind]
+    out = [m]
+    for _ in range(3):
+        if kind != 'O':
+            m = rotate_cw(m)
+            if kind != 'I': m >>= 1
+        out.append(m)
+    return tuple(out)
+
+ORIENTATIONS = {k: orientations(k) for k in BAG}
+
+def shape_cells(m):
+    return [(b & 3, b >> 2) for b in range(16) if m >> b & 1]
+
+def row_masks(m):
+    return [(dy, m >> 4*dy & 0xF) for dy in range(4) if m >> 4*dy & 0xF]
+
+# Flat cell offsets: cell i of (kind, r) lives at KIND_BASE[kind] + r*4 + i
+KIND_BASE = {k: (KIND_IDX[k]-1)*16 for k in BAG}
+DX = array('b', [cx for k in BAG for m in ORIENTATIONS[k] for (cx,cy) in shape_cells(m)])
+DY = array('b', [cy for k in BAG for m in ORIENTATIONS[k] for (cx,cy) in shape_cells(m)])
+
+# Row masks anchored at bit 0 (shift by x+COL_OFF to place), same indexing
+# as DX/DY: entry i of (kind, r) is (MASK_DY[...], MASK_BITS[...]). Shapes
+# spanning fewer than 4 rows repeat their last row so every entry is real.
+def flat_masks():
+    dys, bits = [], []
+    for k in BAG:
+        for m in ORIENTATIONS[k]:
+            rows = row_masks(m)
+            rows += rows[-1:] * (4 - len(rows))
+            dys.extend(dy for dy,_ in rows)
+            bits.extend(b for _,b in rows)
+    return array('b', dys), array('q', bits)
+
+MASK_DY, MASK_BITS = flat_masks()
+
+@njit(cache=True)
+def collides(rows, mask_bits, mask_dy, base, x, y):
+    s = x + COL_OFF
+    for i in range(4):
+        if mask_bits[base+i] << s & rows[y + mask_dy[base+i]]: return True
+    return False
+
+@njit(cache=True)
+def drop_y(rows, mask_bits, mask_dy, base, x, y):
+    while not collides(rows, mask_bits, mask_dy, base, x, y+1):
+        y += 1
+    return y
+
+# Preview offsets: spawn orientation shifted to the top-left corner
+def mini_offsets(shape):
+    minx = min(px for px,py in shape); miny = min(py for px,py in shape)
+    return [(px-minx, py-miny) for (px,py) in shape]
 
-def rot_index(r, d): return (r + d) % 4
+MINI_OFFSETS = {k: mini_offsets(shape_cells(ORIENTATIONS[k][0])) for k in BAG}
+
+# Glyph string for a row's locked cells, keyed by its occupancy bits
+# (at most 2**WELL_W entries, filled in as rows appear)
+ROW_GLYPHS = {}
+
+def row_glyphs(mask):
+    glyphs = ROW_GLYPHS.get(mask)
+    if glyphs is None:
+        glyphs = ROW_GLYPHS[mask] = "".join(
+            CELL if mask >> (x + COL_OFF) & 1 else EMPTY for x in range(WELL_W))
+    return glyphs
+
+def warm_up():
+    # Compile the kernels before the game clock starts
+    rows = empty_rows()
+    drop_y(rows, MASK_BITS, MASK_DY, 0, 3, 0)
 
 class Piece:
+    __slots__ = ('kind', 'r', 'x', 'y')
+
     def __init__(self, kind, x, y):
         self.kind = kind
         self.r = 0
         self.x = x
         self.y = y
     def cells(self, r=None, x=None, y=None):
+        # Allocates a fresh list; only used for rendering
         r = self.r if r is None else r
         x = self.x if x is None else x
         y = self.y if y is None else y
-        return [(x+cx, y+cy) for (cx,cy) in SHAPES[self.kind][r]]
+        base = KIND_BASE[self.kind] + r*4
+        return [(x+DX[base+i], y+DY[base+i]) for i in range(4)]
 
 class SevenBag:
     def __init__(self):
-        self.q = []
+        self.q = deque()
         self.refill()
     def refill(self):
         bag = BAG[:]
@@ -131,23 +232,24 @@ class SevenBag:
         self.q.extend(bag)
     def next(self):
         if len(self.q) < 7: self.refill()
-        return self.q.pop(0)
+        return self.q.popleft()
 
 # --- Game state ---
 class Game:
     def __init__(self):
-        self.board = [[None for _ in range(WELL_W)] for __ in range(WELL_H)]
+        self.rows = empty_rows()
+        self.cells = bytearray(WELL_W*WELL_H)   # row-major, 0 = empty else KIND_IDX
         self.bag = SevenBag()
         self.hold = None
         self.hold_used = False
         self.score = 0
         self.lines = 0
         self.level = 1
-        self.nexts = [self.bag.next() for _ in range(NEXT_COUNT)]
+        self.nexts = deque(self.bag.next() for _ in range(NEXT_COUNT))
         self.game_over = False
         self.fall_timer = 0.0
         self.lock_timer = 0.0
-        self.last_tick = time.time()
+        self.last_tick = time.monotonic()
         self.b2b = False
         self.combo = -1
         self.last_clear_text = ""
@@ -157,6 +259,9 @@ class Game:
         self.finesse_piece_overuses = 0
         # T-Spin helpers
         self.last_action_rotation = False
+        # Render cache: last drawn (glyphs, attrs) per well row + side panel state
+        self._screen = None
+        self._drawn = {}
 
         self.spawn_new()
 
@@ -167,18 +272,16 @@ class Game:
         self.hold_used = False
         self.inputs_this_piece = 0
         self.last_action_rotation = False
-        if not self.valid(self.current.cells()):
+        c = self.current
+        if not self.valid(c.kind, c.r, c.x, c.y):
             self.game_over = True
 
-    def valid(self, cells):
-        for (x,y) in cells:
-            if x < 0 or x >= WELL_W or y < 0 or y >= WELL_H: return False
-            if self.board[y][x] is not None: return False
-        return True
+    def valid(self, kind, r, x, y):
+        return not collides(self.rows, MASK_BITS, MASK_DY, KIND_BASE[kind] + r*4, x, y)
 
     def try_move(self, dx, dy, player_input=False):
         c = self.current
-        if self.valid(c.cells(x=c.x+dx, y=c.y+dy)):
+        if self.valid(c.kind, c.r, c.x+dx, c.y+dy):
             c.x += dx; c.y += dy
             if player_input:
                 self.inputs_this_piece += 1
@@ -189,22 +292,13 @@ class Game:
     def try_rotate(self, d):
         c = self.current
         fr = c.r
-        tr = rot_index(fr, d)
+        tr = (fr + d) & 3       # wraps -1 to 3 as well
         kind = c.kind
 
-        if d == 2:
-            group = 'I' if kind == 'I' else 'JLSTZ'
-            for (dx,dy) in KICKS_180[group]:
-                if self.valid(c.cells(r=tr, x=c.x+dx, y=c.y+dy)):
-                    c.r, c.x, c.y = tr, c.x+dx, c.y+dy
-                    self.inputs_this_piece += 1
-                    self.last_action_rotation = True
-                    return True
-            return False
-
-        group = 'I' if kind == 'I' else 'JLSTZ'
-        for (dx,dy) in SRS_KICKS.get((group, fr, tr), [(0,0)]):
-            if self.valid(c.cells(r=tr, x=c.x+dx, y=c.y+dy)):
+        gi = 0 if kind == 'I' else 1
+        kicks = KICK_TABLE_180[gi] if d == 2 else KICK_TABLE[gi][fr][tr]
+        for (dx,dy) in kicks:
+            if self.valid(kind, tr, c.x+dx, c.y+dy):
                 c.r, c.x, c.y = tr, c.x+dx, c.y+dy
                 self.inputs_this_piece += 1
                 self.last_action_rotation = True
@@ -212,9 +306,9 @@ class Game:
         return False
 
     def hard_drop(self):
-        dist = 0
-        while self.try_move(0, 1):
-            dist += 1
+        c = self.current
+        dist = self.ghost_y() - c.y
+        c.y += dist
         self.score += dist * 2
         self.inputs_this_piece += 1
         self.last_action_rotation = False
@@ -225,13 +319,19 @@ class Game:
             self.score += 1
 
     def on_ground(self):
-        return not self.valid(self.current.cells(y=self.current.y+1))
+        c = self.current
+        return not self.valid(c.kind, c.r, c.x, c.y+1)
 
     def lock_piece(self):
         # Place piece
-        for (x,y) in self.current.cells():
+        c = self.current
+        idx = KIND_IDX[c.kind]
+        base = KIND_BASE[c.kind] + c.r*4
+        for i in range(4):
+            x = c.x + DX[base+i]; y = c.y + DY[base+i]
             if 0 <= y < WELL_H and 0 <= x < WELL_W:
-                self.board[y][x] = self.current.kind
+                self.rows[y] |= 1 << (x + COL_OFF)
+                self.cells[y*WELL_W + x] = idx
 
         # Detect T-Spin (with piece on board)
         tspin_kind = self.detect_tspin()
@@ -244,51 +344,51 @@ class Game:
         self.update_finesse_stats(final_x=self.current.x, final_r=self.current.r)
 
         # Next
-        self.current = Piece(self.nexts.pop(0), 3, 0)
+        self.current = Piece(self.nexts.popleft(), 3, 0)
         self.nexts.append(self.bag.next())
         self.hold_used = False
         self.lock_timer = 0.0
         self.last_action_rotation = False
         self.inputs_this_piece = 0
 
-        if not self.valid(self.current.cells()):
+        c = self.current
+        if not self.valid(c.kind, c.r, c.x, c.y):
             self.game_over = True
 
     def clear_full_lines(self):
-        new_board, cleared = [], 0
-        for row in self.board:
-            if all(cell is not None for cell in row):
-                cleared += 1
-            else:
-                new_board.append(row)
-        while len(new_board) < WELL_H:
-            new_board.insert(0, [None for _ in range(WELL_W)])
-        self.board = new_board
-        if cleared:
-            self.lines += cleared
-            self.level = 1 + self.lines // 10
+        rows, cells = self.rows, self.cells
+        if rows.index(SOLID_ROW) == WELL_H:     # first solid row is the floor
+            return 0
+        cleared = rows.count(SOLID_ROW) - FLOOR_ROWS
+
+        # Shift surviving rows down in place, then blank the top
+        w = WELL_H - 1
+        for y in range(WELL_H-1, -1, -1):
+            if rows[y] == SOLID_ROW: continue
+            if w != y:
+                rows[w] = rows[y]
+                cells[w*WELL_W:(w+1)*WELL_W] = cells[y*WELL_W:(y+1)*WELL_W]
+            w -= 1
+        for y in range(cleared):
+            rows[y] = EMPTY_ROW
+        cells[:cleared*WELL_W] = bytes(cleared*WELL_W)
+
+        self.lines += cleared
+        self.level = 1 + self.lines // 10
         return cleared
 
     # --- T-Spin detection (corner + facing rule) ---
     def detect_tspin(self):
         if self.current.kind != 'T' or not self.last_action_rotation:
             return None
-        cx, cy = self.current.x + 1, self.current.y + 1
-
-        def filled(x, y):
-            if x < 0 or x >= WELL_W or y < 0 or y >= WELL_H:
-                return True
-            return self.board[y][x] is not None
+        rows, x, y = self.rows, self.current.x, self.current.y
 
-        corners = [(cx-1,cy-1),(cx+1,cy-1),(cx-1,cy+1),(cx+1,cy+1)]
-        filled_count = sum(1 for (x,y) in corners if filled(x,y))
+        # Rows above/below the T's box; walls and off-well rows are sentinels
+        s = x + COL_OFF
+        window = (rows[y] >> s & 0b101) | (rows[y+2] >> s & 0b101) << 3
 
-        r = self.current.r
-        if r == 0:     front = [(cx-1,cy-1),(cx+1,cy-1)]
-        elif r == 1:   front = [(cx+1,cy-1),(cx+1,cy+1)]
-        elif r == 2:   front = [(cx-1,cy+1),(cx+1,cy+1)]
-        else:          front = [(cx-1,cy-1),(cx-1,cy+1)]
-        front_filled = sum(1 for (x,y) in front if filled(x,y))
+        filled_count = bin(window).count('1')
+        front_filled = bin(window & T_FRONT_MASK[self.current.r]).count('1')
 
         if filled_count >= 4:
             return 'T'
@@ -335,7 +435,7 @@ class Game:
     # --- Finesse (very simple baseline) ---
     def update_finesse_stats(self, final_x, final_r):
         spawn_x, spawn_r = 3, 0
-        rot_delta = (final_r - spawn_r) % 4
+        rot_delta = (final_r - spawn_r) & 3
         min_rot = min(rot_delta, 4 - rot_delta)
         if rot_delta == 2: min_rot = 1   # 180 key exists
         min_horiz = abs(final_x - spawn_x)
@@ -346,16 +446,13 @@ class Game:
 
     def ghost_y(self):
         c = self.current
-        gy = c.y
-        while self.valid(c.cells(y=gy+1)):
-            gy += 1
-        return gy
+        return drop_y(self.rows, MASK_BITS, MASK_DY, KIND_BASE[c.kind] + c.r*4, c.x, c.y)
 
     def hold_piece(self):
         if self.hold_used: return
         if self.hold is None:
             self.hold = self.current.kind
-            self.current = Piece(self.nexts.pop(0), 3, 0)
+            self.current = Piece(self.nexts.popleft(), 3, 0)
             self.nexts.append(self.bag.next())
         else:
             self.hold, self.current = self.current.kind, Piece(self.hold, 3, 0)
@@ -363,28 +460,44 @@ class Game:
         self.hold_used = True
         self.inputs_this_piece = 0
         self.last_action_rotation = False
-        if not self.valid(self.current.cells()):
+        c = self.current
+        if not self.valid(c.kind, c.r, c.x, c.y):
             self.game_over = True
 
-    def update(self, soft_drop=False):
-        now = time.time()
+    def gravity(self, soft_drop=False):
+        if soft_drop:
+            return SOFT_DROP_MULT
+        return GRAV_TABLE[min(self.level-1, len(GRAV_TABLE)-1)]
+
+    def time_to_next_step(self):
+        # Seconds until update() has work to do; None once the game is over.
+        # Lock delay accrues on gravity steps, so the next step covers it.
+        if self.game_over:
+            return None
+        return max(0.0, self.gravity() - self.fall_timer)
+
+    def update(self, soft_drop=False, now=None):
+        # Returns True if the world changed (piece fell, locked, game over)
+        if now is None: now = time.monotonic()
         dt = now - self.last_tick
         self.last_tick = now
         self.fall_timer += dt
 
-        grav = max(0.06, TICK_BASE * (0.87 ** (self.level-1)))
-        if soft_drop:
-            grav = SOFT_DROP_MULT
+        grav = self.gravity(soft_drop)
 
+        changed = False
         while self.fall_timer >= grav and not self.game_over:
             self.fall_timer -= grav
             if not self.try_move(0,1):
                 self.lock_timer += grav
                 if self.lock_timer >= LOCK_DELAY:
                     self.lock_piece()
+                    changed = True
                     break
             else:
                 self.lock_timer = 0.0
+                changed = True
+        return changed
 
 # --- Curses UI helpers ---
 def safe_addstr(stdscr, y, x, s, attr=0):
@@ -408,20 +521,25 @@ def init_colors():
     curses.init_pair(pair, curses.COLOR_BLUE, -1); border_pair = pair
     return color_map, ghost_pair, ui_pair, border_pair
 
-def draw_border(stdscr, x, y, w, h, color):
-    safe_addstr(stdscr, y,   x, BORDER_TL + BORDER_H*(w-2) + BORDER_TR, curses.color_pair(color))
+def build_attrs(color_map, ghost_pair, ui_pair, border_pair):
+    # Resolve color pairs to attrs once; piece attrs are indexed by cell value
+    attrs = [0]*len(KIND_CHR)
+    for k, pair in color_map.items():
+        attrs[KIND_IDX[k]] = curses.color_pair(pair)
+    ghost_attr = curses.color_pair(ghost_pair) | curses.A_DIM
+    return attrs, ghost_attr, curses.color_pair(ui_pair), curses.color_pair(border_pair)
+
+def draw_border(stdscr, x, y, w, h, attr):
+    safe_addstr(stdscr, y,   x, BORDER_TL + BORDER_H*(w-2) + BORDER_TR, attr)
     for r in range(1,h-1):
-        safe_addstr(stdscr, y+r, x, BORDER_V, curses.color_pair(color))
-        safe_addstr(stdscr, y+r, x+w-1, BORDER_V, curses.color_pair(color))
-    safe_addstr(stdscr, y+h-1, x, BORDER_BL + BORDER_H*(w-2) + BORDER_BR, curses.color_pair(color))
+        safe_addstr(stdscr, y+r, x, BORDER_V, attr)
+        safe_addstr(stdscr, y+r, x+w-1, BORDER_V, attr)
+    safe_addstr(stdscr, y+h-1, x, BORDER_BL + BORDER_H*(w-2) + BORDER_BR, attr)
 
-def draw_mini_piece(stdscr, kind, x, y, colors):
-    shape = SHAPES[kind][0]
-    minx = min(px for px,py in shape); miny = min(py for px,py in shape)
-    for (px,py) in shape:
-        sx = x + (px - minx)*2
-        sy = y + (py - miny)
-        safe_addstr(stdscr, sy, sx, CELL, curses.color_pair(colors[kind]))
+def draw_mini_piece(stdscr, kind, x, y, attrs):
+    attr = attrs[KIND_IDX[kind]]
+    for (dx,dy) in MINI_OFFSETS[kind]:
+        safe_addstr(stdscr, y + dy, x + dx*2, CELL, attr)
 
 def compute_layout(stdscr):
     H, W = stdscr.getmaxyx()
@@ -447,10 +565,11 @@ def compute_layout(stdscr):
         "min_W": total_w, "min_H": total_h
     }
 
-def render(stdscr, game, colors, ghost_pair, ui_pair, border_pair):
-    stdscr.erase()
+def render(stdscr, game, attrs, ghost_attr, ui_attr, border_attr):
     L = compute_layout(stdscr)
     if L["W"] < L["min_W"] or L["H"] < L["min_H"]:
+        stdscr.erase()
+        game._screen = None
         msg = f" Resize terminal to at least {L['min_W']}×{L['min_H']} (cols×rows) "
         safe_addstr(stdscr, max(0, L["H"]//2), max(0, (L["W"]-len(msg))//2), msg, curses.A_BOLD)
         stdscr.refresh(); return
@@ -458,7 +577,6 @@ def render(stdscr, game, colors, ghost_pair, ui_pair, border_pair):
     w_off, h_off = L["w_off"], L["h_off"]
     play_w, play_h = L["play_w"], L["play_h"]
     next_w, hold_w, gap = L["next_w"], L["hold_w"], L["gap"]
-    board_char_w = WELL_W*2
 
     # Panel anchors
     next_x = w_off + play_w + gap
@@ -466,87 +584,134 @@ def render(stdscr, game, colors, ghost_pair, ui_pair, border_pair):
     hold_x = w_off - (hold_w + 2)
     hold_y = h_off
 
-    # Borders
-    draw_border(stdscr, w_off, h_off, play_w, play_h, border_pair)
-    draw_border(stdscr, next_x, next_y, next_w, play_h//2, border_pair)
-    draw_border(stdscr, next_x, next_y + play_h//2 + 1, next_w, play_h - (play_h//2) - 1, border_pair)
-    draw_border(stdscr, hold_x, hold_y, hold_w, 8, border_pair)
-    draw_border(stdscr, hold_x, hold_y + 9, hold_w, 9, border_pair)
-
-    # Titles
-    safe_addstr(stdscr, h_off-1, w_off, " ASCII TETRIS — Aquarium Dark ", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, hold_y, hold_x + 2, " HOLD ", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, next_y, next_x + 2, " NEXT ", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, next_y + play_h//2 + 1, next_x + 2, " INFO ", curses.color_pair(ui_pair))
-
-    # Board cells
-    for y in range(WELL_H):
-        for x in range(WELL_W):
-            cell = game.board[y][x]
-            ch = CELL if cell else EMPTY
-            attr = curses.color_pair(colors[cell]) if cell else 0
-            safe_addstr(stdscr, h_off+1+y, w_off+1 + x*2, ch, attr)
-
-    # Ghost
+    # Full redraw on the first frame and after a resize; otherwise only diffs
+    size = (L["H"], L["W"])
+    if game._screen is None or game._drawn.get("size") != size:
+        stdscr.erase()
+        draw_border(stdscr, w_off, h_off, play_w, play_h, border_attr)
+        safe_addstr(stdscr, h_off-1, w_off, " ASCII TETRIS — Aquarium Dark ", ui_attr)
+        game._screen = [None]*WELL_H
+        game._drawn = {"size": size}
+
+    # Board cells: locked cells give each row's glyphs (cached per occupancy
+    # mask) and attrs; ghost + current are laid over them, then only the
+    # cells that changed since the last frame are written
+    rows, cells = game.rows, game.cells
+
+    overlay = {}
     gy = game.ghost_y()
     for (x,y) in game.current.cells(y=gy):
-        if 0 <= y < WELL_H and 0 <= x < WELL_W:
-            safe_addstr(stdscr, h_off+1+y, w_off+1 + x*2, GHOST, curses.color_pair(ghost_pair) | curses.A_DIM)
-
-    # Current
-    k = game.current.kind
+        overlay.setdefault(y, []).append((x, GHOST, ghost_attr))
+    cur_attr = attrs[KIND_IDX[game.current.kind]]
     for (x,y) in game.current.cells():
-        if 0 <= y < WELL_H and 0 <= x < WELL_W:
-            safe_addstr(stdscr, h_off+1+y, w_off+1 + x*2, CELL, curses.color_pair(colors[k]))
+        overlay.setdefault(y, []).append((x, CELL, cur_attr))
 
-    # Hold piece
-    if game.hold:
-        draw_mini_piece(stdscr, game.hold, hold_x+3, hold_y+3, colors)
+    screen = game._screen
+    for y in range(WELL_H):
+        glyphs = row_glyphs(rows[y] & FULL_MASK)
+        row_attrs = [attrs[c] for c in cells[y*WELL_W:(y+1)*WELL_W]]
+        for (x, ch, attr) in overlay.get(y, ()):
+            if 0 <= x < WELL_W:
+                glyphs = glyphs[:2*x] + ch + glyphs[2*x+2:]
+                row_attrs[x] = attr
+
+        drawn = screen[y]
+        if drawn is None:
+            lo, hi = 0, WELL_W-1
+        else:
+            old_glyphs, old_attrs = drawn
+            if row_attrs == old_attrs and glyphs == old_glyphs: continue
+            changed = [x for x in range(WELL_W)
+                       if row_attrs[x] != old_attrs[x] or glyphs[2*x:2*x+2] != old_glyphs[2*x:2*x+2]]
+            lo, hi = changed[0], changed[-1]
+
+        # Rewrite the changed span with one addstr per run of equal attr
+        x = lo
+        while x <= hi:
+            attr, end = row_attrs[x], x + 1
+            while end <= hi and row_attrs[end] == attr: end += 1
+            safe_addstr(stdscr, h_off+1+y, w_off+1 + x*2, glyphs[2*x:2*end], attr)
+            x = end
+        screen[y] = (glyphs, row_attrs)
 
-    # Next (3)
-    for i,kind in enumerate(game.nexts[:NEXT_COUNT]):
-        draw_mini_piece(stdscr, kind, next_x+2, next_y + 2 + i*6, colors)
+    if game.game_over:
+        msg = "  GAME OVER — press q  "
+        safe_addstr(stdscr, h_off + (play_h//2), w_off + max(1, (play_w - len(msg))//2), msg, curses.A_BOLD)
+        screen[play_h//2 - 1] = None   # the message covers this row
 
-    # Info panel (scoreline + meta)
+    # Side panels: redrawn as a block, and only when their content changed
     ix = next_x + 2
     iy = next_y + play_h//2 + 2
-    safe_addstr(stdscr, iy,     ix, f"Score: {game.score}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 1, ix, f"Lines: {game.lines}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 2, ix, f"Level: {game.level}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 3, ix, f"B2B: {'ON' if game.b2b else 'off'}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 4, ix, f"Combo: {max(game.combo, -1)}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 5, ix, f"Finesse faults: {game.finesse_faults}", curses.color_pair(ui_pair))
-    safe_addstr(stdscr, iy + 6, ix, f"Pieces overused: {game.finesse_piece_overuses}", curses.color_pair(ui_pair))
+    info = [
+        f"Score: {game.score}",
+        f"Lines: {game.lines}",
+        f"Level: {game.level}",
+        f"B2B: {'ON' if game.b2b else 'off'}",
+        f"Combo: {max(game.combo, -1)}",
+        f"Finesse faults: {game.finesse_faults}",
+        f"Pieces overused: {game.finesse_piece_overuses}",
+    ]
     if game.last_clear_text:
-        safe_addstr(stdscr, iy + 7, ix, f"Last: {game.last_clear_text}", curses.color_pair(ui_pair))
-
-    # Controls hint (bottom of info)
+        info.append(f"Last: {game.last_clear_text}")
     hints = ["a/d=move", "s=soft", "w=hard", "j/k=⟲/⟳", "l=180°", "space=Hold", "q=Quit"]
-    for i,h in enumerate(hints):
-        safe_addstr(stdscr, iy + 9 + i, ix, h, curses.color_pair(ui_pair))
 
-    if game.game_over:
-        msg = "  GAME OVER — press q  "
-        safe_addstr(stdscr, h_off + (play_h//2), w_off + max(1, (play_w - len(msg))//2), msg, curses.A_BOLD)
+    side = (game.hold, tuple(game.nexts), tuple(info))
+    if game._drawn.get("side") != side:
+        game._drawn["side"] = side
+
+        # Blank both panel columns (info text may run past the borders)
+        for y in range(hold_y, hold_y + 18):
+            safe_addstr(stdscr, y, hold_x, " "*hold_w)
+        for y in range(next_y, iy + 9 + len(hints)):
+            safe_addstr(stdscr, y, next_x, " "*(L["W"] - next_x))
+
+        # Borders
+        draw_border(stdscr, next_x, next_y, next_w, play_h//2, border_attr)
+        draw_border(stdscr, next_x, next_y + play_h//2 + 1, next_w, play_h - (play_h//2) - 1, border_attr)
+        draw_border(stdscr, hold_x, hold_y, hold_w, 8, border_attr)
+        draw_border(stdscr, hold_x, hold_y + 9, hold_w, 9, border_attr)
+
+        # Titles
+        safe_addstr(stdscr, hold_y, hold_x + 2, " HOLD ", ui_attr)
+        safe_addstr(stdscr, next_y, next_x + 2, " NEXT ", ui_attr)
+        safe_addstr(stdscr, next_y + play_h//2 + 1, next_x + 2, " INFO ", ui_attr)
+
+        # Hold piece
+        if game.hold:
+            draw_mini_piece(stdscr, game.hold, hold_x+3, hold_y+3, attrs)
+
+        # Next (3)
+        for i,kind in enumerate(game.nexts):
+            draw_mini_piece(stdscr, kind, next_x+2, next_y + 2 + i*6, attrs)
+
+        # Info panel (scoreline + meta)
+        for i,line in enumerate(info):
+            safe_addstr(stdscr, iy + i, ix, line, ui_attr)
+
+        # Controls hint (bottom of info)
+        for i,h in enumerate(hints):
+            safe_addstr(stdscr, iy + 9 + i, ix, h, ui_attr)
 
     stdscr.refresh()
 
 # --- Main loop ---
 def main(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
     stdscr.timeout(0)
 
-    colors, ghost_pair, ui_pair, border_pair = init_colors()
+    attrs, ghost_attr, ui_attr, border_attr = build_attrs(*init_colors())
+    warm_up()
     g = Game()
 
     soft_drop = False
-    last_frame = time.time()
+    dirty = True
 
     while True:
-        # Input (drain buffer)
+        # Input: block until a key or the next gravity step, then drain the buffer
         ch = stdscr.getch()
+        stdscr.timeout(0)
         while ch != -1:
+            dirty = True
             if ch in (ord('q'), ord('Q')):
                 return
             if g.game_over:
@@ -572,18 +737,19 @@ def main(stdscr):
             ch = stdscr.getch()
 
         # Update world
-        g.update(soft_drop=soft_drop)
+        now = time.monotonic()
+        if g.update(soft_drop=soft_drop, now=now):
+            dirty = True
         soft_drop = False
 
-        # Render
-        render(stdscr, g, colors, ghost_pair, ui_pair, border_pair)
+        # Render only when something changed
+        if dirty:
+            render(stdscr, g, attrs, ghost_attr, ui_attr, border_attr)
+            dirty = False
 
-        # Frame pacing
-        now = time.time()
-        dt = now - last_frame
-        if dt < 0.01:
-            time.sleep(0.01 - dt)
-        last_frame = now
+        # Sleep in getch() until the next gravity step (forever once game over)
+        wait = g.time_to_next_step()
+        stdscr.timeout(-1 if wait is None else max(1, int(wait * 1000)))
 
 if __name__ == "__main__":
     curses.wrapper(main)